@@ -14,18 +14,18 @@ def register_student(user: UserAuth, db: Session = Depends(get_db)):
     if db.query(Student).filter(Student.email == user.email).first():
         raise HTTPException(status_code=400, detail="Email already registered")
 
-    # 2. Hash password and save to generate the ID
+    # 2. Hash password and flush to generate the ID (no commit yet)
     new_student = Student(email=user.email, hashed_password=hash_password(user.password))
     db.add(new_student)
-    db.commit()
-    db.refresh(new_student) # ID is created here!
+    db.flush() # ID is created here!
 
-    # 3. Generate refresh token with new ID and save it
+    # 3. Generate refresh token with new ID and save everything in one commit
     refresh_token = create_refresh_token(data={"id": new_student.id, "email": new_student.email})
     new_student.refresh_token = refresh_token
+    student_id = new_student.id
     db.commit()
 
-    return {"message": "Registration successful", "student_id": new_student.id}
+    return {"message": "Registration successful", "student_id": student_id}
 
 @router.post("/login", response_model=TokenResponse)
 def login_student(user: UserAuth, db: Session = Depends(get_db)):
@@ -38,12 +38,13 @@ def login_student(user: UserAuth, db: Session = Depends(get_db)):
     access_token = create_access_token(data={"id": db_student.id, "email": db_student.email})
     refresh_token = create_refresh_token(data={"id": db_student.id, "email": db_student.email})
 
-    db_student.refresh_token = refresh_token
-    db.commit()
-
     # Check if the student already has a face registered
+    # (read before commit, which would expire the row and force a reload)
     face_is_registered = db_student.embedding is not None
 
+    db_student.refresh_token = refresh_token
+    db.commit()
+
     return {
         "access_token": access_token, 
         "refresh_token": refresh_token, 
@@ -65,7 +66,7 @@ def register_face(
         embedding = process_and_extract_embedding(request.image_base64)
         student.set_embedding(embedding)
         db.commit()
-        return {"message": "Face verified and securely saved to your account.", "student_id": student.id}
+        return {"message": "Face verified and securely saved to your account.", "student_id": student_id}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -76,9 +77,9 @@ def verify_live_exam_face(
     student_id: int = Depends(get_current_user_id), 
     db: Session = Depends(get_db)
 ):
-    # 1. Fetch the student's saved Baseline Math from the Login phase
-    student = db.query(Student).filter(Student.id == student_id).first()
-    if not student or not student.embedding:
+    # 1. Fetch only the student's saved Baseline Math from the Login phase
+    saved_embedding = db.query(Student.embedding).filter(Student.id == student_id).scalar()
+    if not saved_embedding:
         raise HTTPException(status_code=400, detail="No registered face found. Please log in again.")
 
     try:
@@ -86,7 +87,7 @@ def verify_live_exam_face(
         live_embedding = process_and_extract_embedding(request.image_base64)
         
         # 3. Compare them!
-        is_match = compare_faces(student.embedding, live_embedding)
+        is_match = compare_faces(saved_embedding, live_embedding)
         
         if is_match:
             return {"message": "Identity verified! You may begin the exam.", "match": True}
@@ -1,3 +1,4 @@
+import traceback
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException
@@ -44,8 +45,9 @@ def continuous_identity_check(
     """Continuously verify identity during exam using ArcFace embeddings"""
     print(f"🔍 Continuous identity check for student ID: {user['id']}")
     
-    student = db.query(Student).filter(Student.id == user["id"]).first()
-    if not student or not student.embedding:
+    # Only the stored embedding is needed for this hot, periodic check
+    saved_embedding = db.query(Student.embedding).filter(Student.id == user["id"]).scalar()
+    if not saved_embedding:
         print(f"❌ No registered face found for student {user['id']}")
         raise HTTPException(status_code=400, detail="No registered face found")
 
@@ -64,7 +66,7 @@ def continuous_identity_check(
             }
         
         print("🔄 Comparing embeddings...")
-        is_match = compare_faces(student.embedding, live_embedding)
+        is_match = compare_faces(saved_embedding, live_embedding)
         
         result = "✅ MATCH" if is_match else "❌ MISMATCH"
         print(f"{result} - Identity verification result: {is_match}")
@@ -76,6 +78,5 @@ def continuous_identity_check(
         }
     except Exception as e:
         print(f"❌ Identity verification error: {e}")
-        import traceback
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
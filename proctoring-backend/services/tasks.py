@@ -1,10 +1,14 @@
 import base64
 import os
+from datetime import datetime
 
 from database import SessionLocal
 from models.exam_log import ExamLog
 from services.queue import huey_queue
 
+# Resolved once at import instead of on every snapshot
+BACKEND_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
 def _save_snapshot(snapshot_base64: str, student_id: int) -> str:
     """Save snapshot to snapshots/{student_id}/{timestamp}.jpg"""
     if not snapshot_base64:
@@ -14,15 +18,14 @@ def _save_snapshot(snapshot_base64: str, student_id: int) -> str:
         if "," in snapshot_base64:
             snapshot_base64 = snapshot_base64.split(",", 1)[1]
 
-        backend_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-        student_snapshots_dir = os.path.join(backend_root, "snapshots", str(student_id))
+        relative_dir = os.path.join("snapshots", str(student_id))
+        student_snapshots_dir = os.path.join(BACKEND_ROOT, relative_dir)
         os.makedirs(student_snapshots_dir, exist_ok=True)
 
-        from datetime import datetime
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
         filename = f"{timestamp}.jpg"
-        relative_path = os.path.join("snapshots", str(student_id), filename)
-        absolute_path = os.path.join(backend_root, relative_path)
+        relative_path = os.path.join(relative_dir, filename)
+        absolute_path = os.path.join(student_snapshots_dir, filename)
 
         decoded_data = base64.b64decode(snapshot_base64)
         with open(absolute_path, "wb") as snapshot_file:
@@ -17,7 +17,7 @@ def process_and_extract_embedding(base64_string: str, enforce_detection: bool =
     """
     # 1. Strip the HTML prefix if React sends it (e.g., "data:image/jpeg;base64,...")
     if "," in base64_string:
-        base64_string = base64_string.split(",")[1]
+        base64_string = base64_string.split(",", 1)[1]
         
     # 2. Decode Base64 into an OpenCV image
     img_data = base64.b64decode(base64_string)